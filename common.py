@@ -8,8 +8,8 @@ HEADER_VALUE = 'value'
 
 # CSV headers
 HEADER_CSV_DATE = 'Date & time'
-HEADER_CSV_SOLAR = ' "Solar field net power (MW)"'
-HEADER_CSV_TURBINE = ' "Turbine electric power (MW)"'
+HEADER_CSV_SOLAR = 'Solar field net power (MW)'
+HEADER_CSV_TURBINE = 'Turbine electric power (MW)'
 
 # Colors
 COLOR_PLOTLY_TRANSPARENT = 'rgba(0,0,0,0)'
@@ -88,12 +88,12 @@ def comparison_energy(df, year, month1, month2, power):
         unit='h')
 
 
-def comparison_energy_percentage(df1, df2, year, month1, month2, power):
+def comparison_energy_percentage(df1, df2, year, month1, month2, power1, power2):
     last_day = calendar.monthrange(year, month2)[1]
     sum1 = df1[(df1[HEADER_CSV_DATE].dt.date >= datetime.date(year, month1, 1)) &
-               (df1[HEADER_CSV_DATE].dt.date <= datetime.date(year, month2, last_day))][HEADER_CSV_TURBINE].sum()/power
+               (df1[HEADER_CSV_DATE].dt.date <= datetime.date(year, month2, last_day))][HEADER_CSV_TURBINE].sum()/power1
     sum2 = df2[(df2[HEADER_CSV_DATE].dt.date >= datetime.date(year, month1, 1)) &
-               (df2[HEADER_CSV_DATE].dt.date <= datetime.date(year, month2, last_day))][HEADER_CSV_TURBINE].sum()/power
+               (df2[HEADER_CSV_DATE].dt.date <= datetime.date(year, month2, last_day))][HEADER_CSV_TURBINE].sum()/power2
     if sum1 >= sum2:
         return '-'
     return format_unit(- 100 + 100 * sum1 / sum2, unit='%')
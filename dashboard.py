@@ -1,4 +1,5 @@
 import common
+import ingest_simulations
 import datetime
 import pandas as pd
 import streamlit as st
@@ -11,12 +12,9 @@ default_year = 2
 # PlotLy font size
 figure_font_size = 16
 
-# CSV files
-csv_ns = './csv/csp_data_NS.csv'
-csv_ew = './csv/csp_data_EW.csv'
-
-# PTC plant power
-ptc_installed_power = 50
+# Default simulator runs
+default_run_1 = 'NS'
+default_run_2 = 'EW'
 
 # Hover configuration
 hover_mode = 'closest'
@@ -34,39 +32,42 @@ def load_dataframe(year):
     # Convert from €/MWh to c€/kWh
     # df[common.HEADER_VALUE] = df[common.HEADER_VALUE].apply(lambda value: value / 10)
 
-    # Load from CSV
-    df_ns = pd.read_csv(csv_ns)
-    df_ew = pd.read_csv(csv_ew)
+    return df
+
+
+@st.cache_resource
+def load_simulations():
+    # Catalogue and results of every simulator run (shared between reruns, do not modify them)
+    return ingest_simulations.ingest()
+
+
+@st.cache_data
+def load_simulation(run, year):
+    _, runs = load_simulations()
+    df_run = runs[run].copy()
 
     # Replace year
-    df_ns[common.HEADER_CSV_DATE] = df_ns[common.HEADER_CSV_DATE].apply(lambda value: value.replace('2021', str(year)))
-    df_ew[common.HEADER_CSV_DATE] = df_ew[common.HEADER_CSV_DATE].apply(lambda value: value.replace('2021', str(year)))
-
-    # Convert to date time
-    df_ns[common.HEADER_CSV_DATE] = pd.to_datetime(df_ns[common.HEADER_CSV_DATE], format='%Y-%m-%d %H:%M:%S')
-    df_ew[common.HEADER_CSV_DATE] = pd.to_datetime(df_ew[common.HEADER_CSV_DATE], format='%Y-%m-%d %H:%M:%S')
-
-    # Fix values
-    df_ns[common.HEADER_CSV_SOLAR] = \
-        df_ns[common.HEADER_CSV_SOLAR].apply(lambda value: float(value.replace('"', '').strip()))
-    df_ns[common.HEADER_CSV_TURBINE] = \
-        df_ns[common.HEADER_CSV_TURBINE].apply(lambda value: float(value.replace('"', '').strip()))
-    df_ew[common.HEADER_CSV_SOLAR] = \
-        df_ew[common.HEADER_CSV_SOLAR].apply(lambda value: float(value.replace('"', '').strip()))
-    df_ew[common.HEADER_CSV_TURBINE] = \
-        df_ew[common.HEADER_CSV_TURBINE].apply(lambda value: float(value.replace('"', '').strip()))
-
-    # Ignore negative values
-    df_ns[common.HEADER_CSV_SOLAR] = \
-        df_ns[common.HEADER_CSV_SOLAR].apply(lambda value: max(0, value))
-    df_ns[common.HEADER_CSV_TURBINE] = \
-        df_ns[common.HEADER_CSV_TURBINE].apply(lambda value: max(0, value))
-    df_ew[common.HEADER_CSV_SOLAR] = \
-        df_ew[common.HEADER_CSV_SOLAR].apply(lambda value: max(0, value))
-    df_ew[common.HEADER_CSV_TURBINE] = \
-        df_ew[common.HEADER_CSV_TURBINE].apply(lambda value: max(0, value))
-
-    return df, df_ns, df_ew
+    date = df_run[common.HEADER_CSV_DATE]
+    df_run[common.HEADER_CSV_DATE] = pd.to_datetime(pd.DataFrame({'year': year, 'month': date.dt.month,
+                                                                  'day': date.dt.day, 'hour': date.dt.hour,
+                                                                  'minute': date.dt.minute,
+                                                                  'second': date.dt.second}),
+                                                    errors='coerce')
+
+    # Drop dates missing in the new year (Feb 29) and renumber the rows, prices are matched by row
+    return df_run[df_run[common.HEADER_CSV_DATE].notna()].reset_index(drop=True)
+
+
+def run_label(catalogue, run):
+    plant = catalogue.loc[run]
+    return f'{plant["orientation"]} ({run})'
+
+
+def default_indexes(runs):
+    # Default runs if available, otherwise the first runs not already selected
+    indexes = [runs.index(run) if run in runs else None for run in (default_run_1, default_run_2)]
+    free = [index for index in range(len(runs)) if index not in indexes]
+    return [index if index is not None else free.pop(0) if free else 0 for index in indexes]
 
 
 def configuration(max_width: int = 1000):
@@ -103,6 +104,15 @@ def dashboard():
     # Side bar
     st.sidebar.markdown('## Year')
     year = st.sidebar.radio(' ', years, index=default_year)
+    catalogue, simulations = load_simulations()
+    runs = [run for run in catalogue.index if run in simulations]
+    if not runs:
+        st.error(f'No simulator runs found in {ingest_simulations.folder}')
+        st.stop()
+    index_1, index_2 = default_indexes(runs)
+    st.sidebar.markdown('## Simulations')
+    run_1 = st.sidebar.selectbox('Plant 1', runs, index=index_1, format_func=lambda run: run_label(catalogue, run))
+    run_2 = st.sidebar.selectbox('Plant 2', runs, index=index_2, format_func=lambda run: run_label(catalogue, run))
     st.sidebar.markdown('## Sections')
     st.sidebar.markdown(common.styled_link('Spanish Power Market Auction', '#spanish-power-market-auction'),
                         unsafe_allow_html=True)
@@ -129,14 +139,20 @@ def dashboard():
     last_date = col2.date_input('To', value=year_last, min_value=year_first, max_value=year_last, key=None)
 
     # Dataframe
-    df, df_ns, df_ew = load_dataframe(year)
+    df = load_dataframe(year)
+    df_1 = load_simulation(run_1, year)
+    df_2 = load_simulation(run_2, year)
+    label_1 = run_label(catalogue, run_1)
+    label_2 = run_label(catalogue, run_2)
+    installed_power_1 = catalogue.loc[run_1, 'power']
+    installed_power_2 = catalogue.loc[run_2, 'power']
 
     # Filter by date
     df = df[(df[common.HEADER_DATE].dt.date >= first_date) & (df[common.HEADER_DATE].dt.date <= last_date)]
-    df_ns = df_ns[(df_ns[common.HEADER_CSV_DATE].dt.date >= first_date) &
-                  (df_ns[common.HEADER_CSV_DATE].dt.date <= last_date)]
-    df_ew = df_ew[(df_ew[common.HEADER_CSV_DATE].dt.date >= first_date) &
-                  (df_ew[common.HEADER_CSV_DATE].dt.date <= last_date)]
+    df_1 = df_1[(df_1[common.HEADER_CSV_DATE].dt.date >= first_date) &
+                (df_1[common.HEADER_CSV_DATE].dt.date <= last_date)]
+    df_2 = df_2[(df_2[common.HEADER_CSV_DATE].dt.date >= first_date) &
+                (df_2[common.HEADER_CSV_DATE].dt.date <= last_date)]
 
     # Average price
     value_len = len(df[common.HEADER_VALUE])
@@ -165,105 +181,108 @@ def dashboard():
     st.header('Power Plant and Simulation Description')
     st.markdown('''
     - **Facility:** Parabolic-Trough Collector (PTC) Solar Thermal Power Plant
-        - **Power:** 50 MW
-        - **Thermal storage:** 8 hours
     - **Data:** Typical Meteorological Year (TMY)
-        - **Location:** Almería, Spain
         - **Source:** [PVGIS](https://ec.europa.eu/jrc/en/pvgis)
     - **Operation:** Continuously dispatch 
     - **Simulator:** [PTC Power Plant Performance](https://ptc-performance.web.app/)    
     ''')
+    st.markdown('#### Simulator runs')
+    for file, error in catalogue[catalogue['error'].notna()][['file', 'error']].itertuples(index=False):
+        st.warning(f'Error reading file {file}: {error}')
+    st.dataframe(catalogue.rename(columns={'orientation': 'Orientation', 'site': 'Location', 'power': 'Power (MW)',
+                                           'storage': 'Thermal storage (h)', 'year': 'TMY year',
+                                           'file': 'File', 'error': 'Error'}))
     st.header('Results')
     # ---------------------
-    # North-south PTC plant
+    # First PTC plant
     # ---------------------
-    col_ns, col_ew = st.columns([0.5, 0.5])
-    col_ns.header('North-south')
-    col_ns.subheader('')
+    col_1, col_2 = st.columns([0.5, 0.5])
+    col_1.header(label_1)
+    col_1.subheader('')
 
     # Solar production
-    col_ns.subheader('Solar field net production')
-    csp_ns = go.Scatter(x=df_ns[common.HEADER_CSV_DATE], y=df_ns[common.HEADER_CSV_SOLAR], name='Solar field',
-                        mode='lines', line=dict(width=2, color=common.COLOR_SOLAR), fill='tozeroy',
-                        fillcolor=common.COLOR_SOLAR,
-                        hovertemplate=solar_hover_template)
-    layout_csp_ns = go.Layout(xaxis=dict(title=''), yaxis=dict(title='Solar field net power', tickformat='0,000.00f',
-                                                               hoverformat=',.2f', ticksuffix=' MW',
-                                                               separatethousands=True),
-                              hoverlabel=dict(font=dict(color='white')))
-    fig_csp_ns = go.Figure(data=[csp_ns], layout=layout_csp_ns)
-    fig_csp_ns.update_layout(font_size=figure_font_size, hovermode=hover_mode,  hoverlabel=hover_label)
-    col_ns.plotly_chart(fig_csp_ns, use_container_width=True)
+    col_1.subheader('Solar field net production')
+    csp_1 = go.Scatter(x=df_1[common.HEADER_CSV_DATE], y=df_1[common.HEADER_CSV_SOLAR], name='Solar field',
+                       mode='lines', line=dict(width=2, color=common.COLOR_SOLAR), fill='tozeroy',
+                       fillcolor=common.COLOR_SOLAR,
+                       hovertemplate=solar_hover_template)
+    layout_csp_1 = go.Layout(xaxis=dict(title=''), yaxis=dict(title='Solar field net power', tickformat='0,000.00f',
+                                                              hoverformat=',.2f', ticksuffix=' MW',
+                                                              separatethousands=True),
+                             hoverlabel=dict(font=dict(color='white')))
+    fig_csp_1 = go.Figure(data=[csp_1], layout=layout_csp_1)
+    fig_csp_1.update_layout(font_size=figure_font_size, hovermode=hover_mode,  hoverlabel=hover_label)
+    col_1.plotly_chart(fig_csp_1, use_container_width=True)
 
     # Turbine production
-    col_ns.subheader('Turbine electric power')
-    power_ns = go.Scatter(x=df_ns[common.HEADER_CSV_DATE], y=df_ns[common.HEADER_CSV_TURBINE], name='Turbine',
-                          mode='lines', line=dict(width=2, color=common.COLOR_TURBINE), fill='tozeroy',
-                          fillcolor=common.COLOR_TURBINE,
-                          hovertemplate=turbine_hover_template)
-    layout_power_ns = go.Layout(xaxis=dict(title=''), yaxis=dict(title='Turbine power', tickformat='0,000.00f',
-                                                                 hoverformat=',.2f', ticksuffix=' MW',
-                                                                 separatethousands=True),
-                                hoverlabel=dict(font=dict(color='white')))
-    fig_power_ns = go.Figure(data=[power_ns], layout=layout_power_ns)
-    fig_power_ns.update_layout(font_size=figure_font_size, hovermode=hover_mode,  hoverlabel=hover_label)
-    col_ns.plotly_chart(fig_power_ns, use_container_width=True)
-    col_ns.markdown('Equivalent hours: **'
-                    f'{common.format_unit(df_ns[common.HEADER_CSV_TURBINE].sum()/ptc_installed_power, unit="h")}**')
+    col_1.subheader('Turbine electric power')
+    power_1 = go.Scatter(x=df_1[common.HEADER_CSV_DATE], y=df_1[common.HEADER_CSV_TURBINE], name='Turbine',
+                         mode='lines', line=dict(width=2, color=common.COLOR_TURBINE), fill='tozeroy',
+                         fillcolor=common.COLOR_TURBINE,
+                         hovertemplate=turbine_hover_template)
+    layout_power_1 = go.Layout(xaxis=dict(title=''), yaxis=dict(title='Turbine power', tickformat='0,000.00f',
+                                                                hoverformat=',.2f', ticksuffix=' MW',
+                                                                separatethousands=True),
+                               hoverlabel=dict(font=dict(color='white')))
+    fig_power_1 = go.Figure(data=[power_1], layout=layout_power_1)
+    fig_power_1.update_layout(font_size=figure_font_size, hovermode=hover_mode,  hoverlabel=hover_label)
+    col_1.plotly_chart(fig_power_1, use_container_width=True)
+    col_1.markdown('Equivalent hours: **'
+                   f'{common.format_unit(df_1[common.HEADER_CSV_TURBINE].sum()/installed_power_1, unit="h")}**')
 
     # Earnings
-    col_ns.subheader('Earnings')
-    earnings_ns = df_ns[common.HEADER_CSV_TURBINE] * df[common.HEADER_VALUE]
-    power_ns = go.Scatter(x=df_ns[common.HEADER_CSV_DATE], y=earnings_ns,
-                          name='Earnings', mode='lines', line=dict(width=2, color=common.COLOR_PRICE), fill='tozeroy',
-                          fillcolor=common.COLOR_PRICE, hovertemplate=price_hover_template)
-    layout_earnings_ns = go.Layout(xaxis=dict(title=''), yaxis=dict(title='Earnings', tickformat='0,000.00f',
-                                                                    hoverformat=',.2f', ticksuffix=' €',
-                                                                    separatethousands=True),
-                                   hoverlabel=dict(font=dict(color='white')))
-    fig_power_ns = go.Figure(data=[power_ns], layout=layout_earnings_ns)
-    fig_power_ns.update_layout(font_size=figure_font_size, hovermode=hover_mode,  hoverlabel=hover_label)
-    col_ns.plotly_chart(fig_power_ns, use_container_width=True)
-    col_ns.markdown(f'Total earnings: **{common.format_unit(earnings_ns.sum())}**')
+    col_1.subheader('Earnings')
+    earnings_1 = df_1[common.HEADER_CSV_TURBINE] * df[common.HEADER_VALUE]
+    power_1 = go.Scatter(x=df_1[common.HEADER_CSV_DATE], y=earnings_1,
+                         name='Earnings', mode='lines', line=dict(width=2, color=common.COLOR_PRICE), fill='tozeroy',
+                         fillcolor=common.COLOR_PRICE, hovertemplate=price_hover_template)
+    layout_earnings_1 = go.Layout(xaxis=dict(title=''), yaxis=dict(title='Earnings', tickformat='0,000.00f',
+                                                                   hoverformat=',.2f', ticksuffix=' €',
+                                                                   separatethousands=True),
+                                  hoverlabel=dict(font=dict(color='white')))
+    fig_power_1 = go.Figure(data=[power_1], layout=layout_earnings_1)
+    fig_power_1.update_layout(font_size=figure_font_size, hovermode=hover_mode,  hoverlabel=hover_label)
+    col_1.plotly_chart(fig_power_1, use_container_width=True)
+    col_1.markdown(f'Total earnings: **{common.format_unit(earnings_1.sum())}**')
 
     # ---------------------
-    # East-west PTC plant
+    # Second PTC plant
     # ---------------------
-    col_ew.header('East-west')
-    col_ew.title('')
+    col_2.header(label_2)
+    col_2.title('')
 
     # Solar production
-    col_ew.subheader('Solar field net production')
-    csp_ew = go.Scatter(x=df_ew[common.HEADER_CSV_DATE], y=df_ew[common.HEADER_CSV_SOLAR], name='Solar field',
-                        mode='lines', line=dict(width=2, color=common.COLOR_SOLAR), fill='tozeroy',
-                        fillcolor=common.COLOR_SOLAR,
-                        hovertemplate=solar_hover_template)
-    fig_csp_ew = go.Figure(data=[csp_ew], layout=layout_csp_ns)
-    fig_csp_ew.update_layout(font_size=figure_font_size, hovermode=hover_mode,  hoverlabel=hover_label)
-    col_ew.plotly_chart(fig_csp_ew, use_container_width=True)
+    col_2.subheader('Solar field net production')
+    csp_2 = go.Scatter(x=df_2[common.HEADER_CSV_DATE], y=df_2[common.HEADER_CSV_SOLAR], name='Solar field',
+                       mode='lines', line=dict(width=2, color=common.COLOR_SOLAR), fill='tozeroy',
+                       fillcolor=common.COLOR_SOLAR,
+                       hovertemplate=solar_hover_template)
+    fig_csp_2 = go.Figure(data=[csp_2], layout=layout_csp_1)
+    fig_csp_2.update_layout(font_size=figure_font_size, hovermode=hover_mode,  hoverlabel=hover_label)
+    col_2.plotly_chart(fig_csp_2, use_container_width=True)
 
     # Turbine production
-    col_ew.subheader('Turbine electric power')
-    power_ew = go.Scatter(x=df_ew[common.HEADER_CSV_DATE], y=df_ew[common.HEADER_CSV_TURBINE], name='Turbine',
-                          mode='lines', line=dict(width=2, color=common.COLOR_TURBINE), fill='tozeroy',
-                          fillcolor=common.COLOR_TURBINE, hovertemplate=turbine_hover_template)
-    fig_power_ew = go.Figure(data=[power_ew], layout=layout_power_ns)
-    fig_power_ew.update_layout(font_size=figure_font_size, hovermode=hover_mode,  hoverlabel=hover_label)
-    col_ew.plotly_chart(fig_power_ew, use_container_width=True)
-    col_ew.markdown('Equivalent hours: **'
-                f'{common.format_unit(df_ew[common.HEADER_CSV_TURBINE].sum()/ptc_installed_power, unit="h")}**')
+    col_2.subheader('Turbine electric power')
+    power_2 = go.Scatter(x=df_2[common.HEADER_CSV_DATE], y=df_2[common.HEADER_CSV_TURBINE], name='Turbine',
+                         mode='lines', line=dict(width=2, color=common.COLOR_TURBINE), fill='tozeroy',
+                         fillcolor=common.COLOR_TURBINE, hovertemplate=turbine_hover_template)
+    fig_power_2 = go.Figure(data=[power_2], layout=layout_power_1)
+    fig_power_2.update_layout(font_size=figure_font_size, hovermode=hover_mode,  hoverlabel=hover_label)
+    col_2.plotly_chart(fig_power_2, use_container_width=True)
+    col_2.markdown('Equivalent hours: **'
+                   f'{common.format_unit(df_2[common.HEADER_CSV_TURBINE].sum()/installed_power_2, unit="h")}**')
 
     # Earnings
-    col_ew.subheader('Earnings')
-    earnings_ew = df_ew[common.HEADER_CSV_TURBINE] * df[common.HEADER_VALUE]
-    power_ew = go.Scatter(x=df_ew[common.HEADER_CSV_DATE], y=earnings_ew,
-                          name='Earnings', mode='lines', line=dict(width=2, color=common.COLOR_PRICE), fill='tozeroy',
-                          fillcolor=common.COLOR_PRICE,
-                          hovertemplate=price_hover_template)
-    fig_power_ns = go.Figure(data=[power_ew], layout=layout_earnings_ns)
-    fig_power_ns.update_layout(font_size=figure_font_size, hovermode=hover_mode,  hoverlabel=hover_label)
-    col_ew.plotly_chart(fig_power_ns, use_container_width=True)
-    col_ew.markdown(f'Total earnings: **{common.format_unit(earnings_ew.sum())}**')
+    col_2.subheader('Earnings')
+    earnings_2 = df_2[common.HEADER_CSV_TURBINE] * df[common.HEADER_VALUE]
+    power_2 = go.Scatter(x=df_2[common.HEADER_CSV_DATE], y=earnings_2,
+                         name='Earnings', mode='lines', line=dict(width=2, color=common.COLOR_PRICE), fill='tozeroy',
+                         fillcolor=common.COLOR_PRICE,
+                         hovertemplate=price_hover_template)
+    fig_power_1 = go.Figure(data=[power_2], layout=layout_earnings_1)
+    fig_power_1.update_layout(font_size=figure_font_size, hovermode=hover_mode,  hoverlabel=hover_label)
+    col_2.plotly_chart(fig_power_1, use_container_width=True)
+    col_2.markdown(f'Total earnings: **{common.format_unit(earnings_2.sum())}**')
 
     # Comparison
     col_comp1, col_comp2 = st.columns([0.5, 0.5])
@@ -271,126 +290,126 @@ def dashboard():
     col_comp1.subheader('Energy comparison per month')
     data = {
         'Jan': [
-            common.comparison_energy(df_ns, year, 1, 1, ptc_installed_power),
-            common.comparison_energy(df_ew, year, 1, 1, ptc_installed_power)
+            common.comparison_energy(df_1, year, 1, 1, installed_power_1),
+            common.comparison_energy(df_2, year, 1, 1, installed_power_2)
         ],
         'Feb': [
-            common.comparison_energy(df_ns, year, 2, 2, ptc_installed_power),
-            common.comparison_energy(df_ew, year, 2, 2, ptc_installed_power)
+            common.comparison_energy(df_1, year, 2, 2, installed_power_1),
+            common.comparison_energy(df_2, year, 2, 2, installed_power_2)
         ],
         'Mar': [
-            common.comparison_energy(df_ns, year, 3, 3, ptc_installed_power),
-            common.comparison_energy(df_ew, year, 3, 3, ptc_installed_power)
+            common.comparison_energy(df_1, year, 3, 3, installed_power_1),
+            common.comparison_energy(df_2, year, 3, 3, installed_power_2)
         ],
         'Apr': [
-            common.comparison_energy(df_ns, year, 4, 4, ptc_installed_power),
-            common.comparison_energy(df_ew, year, 4, 4, ptc_installed_power)
+            common.comparison_energy(df_1, year, 4, 4, installed_power_1),
+            common.comparison_energy(df_2, year, 4, 4, installed_power_2)
         ],
         'May': [
-            common.comparison_energy(df_ns, year, 5, 5, ptc_installed_power),
-            common.comparison_energy(df_ew, year, 5, 5, ptc_installed_power)
+            common.comparison_energy(df_1, year, 5, 5, installed_power_1),
+            common.comparison_energy(df_2, year, 5, 5, installed_power_2)
         ],
         'Jun': [
-            common.comparison_energy(df_ns, year, 6, 6, ptc_installed_power),
-            common.comparison_energy(df_ew, year, 6, 6, ptc_installed_power)
+            common.comparison_energy(df_1, year, 6, 6, installed_power_1),
+            common.comparison_energy(df_2, year, 6, 6, installed_power_2)
         ],
         'Jul': [
-            common.comparison_energy(df_ns, year, 7, 7, ptc_installed_power),
-            common.comparison_energy(df_ew, year, 7, 7, ptc_installed_power)
+            common.comparison_energy(df_1, year, 7, 7, installed_power_1),
+            common.comparison_energy(df_2, year, 7, 7, installed_power_2)
         ],
         'Aug': [
-            common.comparison_energy(df_ns, year, 8, 8, ptc_installed_power),
-            common.comparison_energy(df_ew, year, 8, 8, ptc_installed_power)
+            common.comparison_energy(df_1, year, 8, 8, installed_power_1),
+            common.comparison_energy(df_2, year, 8, 8, installed_power_2)
         ],
         'Sep': [
-            common.comparison_energy(df_ns, year, 9, 9, ptc_installed_power),
-            common.comparison_energy(df_ew, year, 9, 9, ptc_installed_power)
+            common.comparison_energy(df_1, year, 9, 9, installed_power_1),
+            common.comparison_energy(df_2, year, 9, 9, installed_power_2)
         ],
         'Oct': [
-            common.comparison_energy(df_ns, year, 10, 10, ptc_installed_power),
-            common.comparison_energy(df_ew, year, 10, 10, ptc_installed_power)
+            common.comparison_energy(df_1, year, 10, 10, installed_power_1),
+            common.comparison_energy(df_2, year, 10, 10, installed_power_2)
         ],
         'Nov': [
-            common.comparison_energy(df_ns, year, 11, 11, ptc_installed_power),
-            common.comparison_energy(df_ew, year, 11, 11, ptc_installed_power)
+            common.comparison_energy(df_1, year, 11, 11, installed_power_1),
+            common.comparison_energy(df_2, year, 11, 11, installed_power_2)
         ],
         'Dec': [
-            common.comparison_energy(df_ns, year, 12, 12, ptc_installed_power),
-            common.comparison_energy(df_ew, year, 12, 12, ptc_installed_power)
+            common.comparison_energy(df_1, year, 12, 12, installed_power_1),
+            common.comparison_energy(df_2, year, 12, 12, installed_power_2)
         ],
         'Total': [
-            common.comparison_energy(df_ns, year, 1, 12, ptc_installed_power),
-            common.comparison_energy(df_ew, year, 1, 12, ptc_installed_power)
+            common.comparison_energy(df_1, year, 1, 12, installed_power_1),
+            common.comparison_energy(df_2, year, 1, 12, installed_power_2)
         ],
         '%': [
-            common.comparison_energy_percentage(df_ns, df_ew, year, 1, 12, ptc_installed_power),
-            common.comparison_energy_percentage(df_ew, df_ns, year, 1, 12, ptc_installed_power)
+            common.comparison_energy_percentage(df_1, df_2, year, 1, 12, installed_power_1, installed_power_2),
+            common.comparison_energy_percentage(df_2, df_1, year, 1, 12, installed_power_2, installed_power_1)
         ]
     }
-    df_comp = pd.DataFrame(data, index=['North-south', 'East-west'])
+    df_comp = pd.DataFrame(data, index=[label_1, label_2])
     col_comp1.dataframe(df_comp.transpose().style.apply(df_style, axis=1), height=529)
 
     # Comparison
     col_comp2.subheader('Earnings comparison per month')
     data = {
         'Jan': [
-            common.comparison_datasets(df_ns, df, year, 1, 1),
-            common.comparison_datasets(df_ew, df, year, 1, 1)
+            common.comparison_datasets(df_1, df, year, 1, 1),
+            common.comparison_datasets(df_2, df, year, 1, 1)
         ],
         'Feb': [
-            common.comparison_datasets(df_ns, df, year, 2, 2),
-            common.comparison_datasets(df_ew, df, year, 2, 2)
+            common.comparison_datasets(df_1, df, year, 2, 2),
+            common.comparison_datasets(df_2, df, year, 2, 2)
         ],
         'Mar': [
-            common.comparison_datasets(df_ns, df, year, 3, 3),
-            common.comparison_datasets(df_ew, df, year, 3, 3)
+            common.comparison_datasets(df_1, df, year, 3, 3),
+            common.comparison_datasets(df_2, df, year, 3, 3)
         ],
         'Apr': [
-            common.comparison_datasets(df_ns, df, year, 4, 4),
-            common.comparison_datasets(df_ew, df, year, 4, 4)
+            common.comparison_datasets(df_1, df, year, 4, 4),
+            common.comparison_datasets(df_2, df, year, 4, 4)
         ],
         'May': [
-            common.comparison_datasets(df_ns, df, year, 5, 5),
-            common.comparison_datasets(df_ew, df, year, 5, 5)
+            common.comparison_datasets(df_1, df, year, 5, 5),
+            common.comparison_datasets(df_2, df, year, 5, 5)
         ],
         'Jun': [
-            common.comparison_datasets(df_ns, df, year, 6, 6),
-            common.comparison_datasets(df_ew, df, year, 6, 6)
+            common.comparison_datasets(df_1, df, year, 6, 6),
+            common.comparison_datasets(df_2, df, year, 6, 6)
         ],
         'Jul': [
-            common.comparison_datasets(df_ns, df, year, 7, 7),
-            common.comparison_datasets(df_ew, df, year, 7, 7)
+            common.comparison_datasets(df_1, df, year, 7, 7),
+            common.comparison_datasets(df_2, df, year, 7, 7)
         ],
         'Aug': [
-            common.comparison_datasets(df_ns, df, year, 8, 8),
-            common.comparison_datasets(df_ew, df, year, 8, 8)
+            common.comparison_datasets(df_1, df, year, 8, 8),
+            common.comparison_datasets(df_2, df, year, 8, 8)
         ],
         'Sep': [
-            common.comparison_datasets(df_ns, df, year, 9, 9),
-            common.comparison_datasets(df_ew, df, year, 9, 9)
+            common.comparison_datasets(df_1, df, year, 9, 9),
+            common.comparison_datasets(df_2, df, year, 9, 9)
         ],
         'Oct': [
-            common.comparison_datasets(df_ns, df, year, 10, 10),
-            common.comparison_datasets(df_ew, df, year, 10, 10)
+            common.comparison_datasets(df_1, df, year, 10, 10),
+            common.comparison_datasets(df_2, df, year, 10, 10)
         ],
         'Nov': [
-            common.comparison_datasets(df_ns, df, year, 11, 11),
-            common.comparison_datasets(df_ew, df, year, 11, 11)
+            common.comparison_datasets(df_1, df, year, 11, 11),
+            common.comparison_datasets(df_2, df, year, 11, 11)
         ],
         'Dec': [
-            common.comparison_datasets(df_ns, df, year, 12, 12),
-            common.comparison_datasets(df_ew, df, year, 12, 12)
+            common.comparison_datasets(df_1, df, year, 12, 12),
+            common.comparison_datasets(df_2, df, year, 12, 12)
         ],
         'Total': [
-            common.comparison_datasets(df_ns, df, year, 1, 12),
-            common.comparison_datasets(df_ew, df, year, 1, 12)
+            common.comparison_datasets(df_1, df, year, 1, 12),
+            common.comparison_datasets(df_2, df, year, 1, 12)
         ],
         '%': [
-            common.comparison_economic_percentage(df_ns, df_ew, df, year, 1, 12),
-            common.comparison_economic_percentage(df_ew, df_ns, df, year, 1, 12)
+            common.comparison_economic_percentage(df_1, df_2, df, year, 1, 12),
+            common.comparison_economic_percentage(df_2, df_1, df, year, 1, 12)
         ]
     }
-    df_comp = pd.DataFrame(data, index=['North-south', 'East-west'])
+    df_comp = pd.DataFrame(data, index=[label_1, label_2])
     col_comp2.dataframe(df_comp.transpose().style.apply(df_style, axis=1), height=529)
 
 
@@ -0,0 +1,150 @@
+import os
+import re
+import time
+import common
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.compute as pc
+from concurrent.futures import ThreadPoolExecutor
+
+# Simulator output from PTC Power Plant Performance
+# https://ptc-performance.web.app/
+#
+# File names follow the pattern csp_data_<orientation>[_<tag>...].csv, where the optional tags are
+# <n>mw (installed power), <n>h (thermal storage hours) or any other word. The other words, in order and
+# joined with '_', are the site. Examples:
+#   csp_data_NS.csv
+#   csp_data_EW_sevilla_12h.csv
+#   csp_data_NS_almeria_100mw_8h.csv
+#   csp_data_EW_la_palma_8h.csv (site la_palma)
+
+# Simulator files
+folder = './csv'
+filename_prefix = 'csp_data_'
+filename_extension = '.csv'
+
+# SET NUMBER OF THREADS (files read at the same time, each file is also parsed with several threads)
+threads = 8
+
+# Default plant metadata (used when not specified in the file name)
+default_power = 50
+default_storage = 8
+default_site = 'almeria'
+
+# Orientation names
+orientations = {
+    'NS': 'North-south',
+    'EW': 'East-west',
+}
+
+# Columns used by the dashboard
+columns = [common.HEADER_CSV_DATE, common.HEADER_CSV_SOLAR, common.HEADER_CSV_TURBINE]
+
+# Characters around the simulator values, e.g. ' "7.440 "'
+padding_chars = ' "'
+
+
+def is_simulation_file(filename):
+    return filename.startswith(filename_prefix) and filename.endswith(filename_extension)
+
+
+def discover_files(input_folder):
+    return sorted(os.path.join(input_folder, filename) for filename in os.listdir(input_folder)
+                  if is_simulation_file(filename))
+
+
+def read_header(file):
+    with open(file, encoding='utf-8-sig') as f:
+        return [name.strip(padding_chars) for name in f.readline().rstrip('\r\n').split(',')]
+
+
+def filename_metadata(file):
+    run = os.path.basename(file)[len(filename_prefix):-len(filename_extension)]
+    tags = run.split('_')
+    orientation = tags[0].upper()
+    metadata = {
+        'run': run,
+        'orientation': orientations.get(orientation, orientation),
+        'site': default_site,
+        'power': default_power,
+        'storage': default_storage,
+    }
+    site = []
+    for tag in tags[1:]:
+        tag = tag.lower()
+        if re.fullmatch(r'\d+(\.\d+)?mw', tag):
+            metadata['power'] = float(tag[:-2])
+        elif re.fullmatch(r'\d+(\.\d+)?h', tag):
+            metadata['storage'] = float(tag[:-1])
+        else:
+            site.append(tag)
+    if site:
+        metadata['site'] = '_'.join(site)
+    return metadata
+
+
+def csv_to_dataframe(file, input_columns=None):
+    # Read the selected columns as text, the quoted and space-padded numbers are cleaned column by column afterwards
+    input_columns = input_columns or columns
+    column_types = {name: pa.string() for name in input_columns if name != common.HEADER_CSV_DATE}
+    column_types[common.HEADER_CSV_DATE] = pa.timestamp('s')
+    table = pa_csv.read_csv(file,
+                            read_options=pa_csv.ReadOptions(use_threads=True, skip_rows=1,
+                                                            column_names=read_header(file)),
+                            convert_options=pa_csv.ConvertOptions(column_types=column_types,
+                                                                  include_columns=input_columns))
+
+    # Fix values
+    values = [table.column(name) if name == common.HEADER_CSV_DATE else
+              pc.cast(pc.utf8_trim(table.column(name), padding_chars), pa.float64()) for name in input_columns]
+    df = pa.table(values, names=input_columns).to_pandas()
+
+    # Ignore negative values
+    df[common.HEADER_CSV_SOLAR] = df[common.HEADER_CSV_SOLAR].clip(lower=0)
+    df[common.HEADER_CSV_TURBINE] = df[common.HEADER_CSV_TURBINE].clip(lower=0)
+    return df
+
+
+def ingest_file(file):
+    # Files that cannot be read are kept in the catalogue with the error and without results
+    metadata = filename_metadata(file)
+    metadata['file'] = file
+    try:
+        df = csv_to_dataframe(file)
+        if df[common.HEADER_CSV_DATE].isna().all():
+            raise ValueError('no dated rows')
+        metadata['year'] = df[common.HEADER_CSV_DATE].dropna().dt.year.iloc[0]
+    except Exception as e:
+        metadata['year'] = None
+        metadata['error'] = str(e)
+        return metadata, None
+    metadata['error'] = None
+    return metadata, df
+
+
+def ingest(input_folder=folder):
+    # Catalogue of runs (one row per simulator file) and simulation results by run
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        results = list(executor.map(ingest_file, discover_files(input_folder)))
+    catalogue = pd.DataFrame([metadata for metadata, _ in results]).set_index('run') \
+        if results else pd.DataFrame(columns=['orientation', 'site', 'power', 'storage', 'file', 'year', 'error'])
+    catalogue = catalogue.astype({'year': 'Int64'})
+    runs = {metadata['run']: df for metadata, df in results if df is not None}
+    return catalogue, runs
+
+
+# Main function
+def main(input_folder):
+    start = time.perf_counter()
+    catalogue, runs = ingest(input_folder)
+    print(catalogue.to_string())
+    print(f'Ingested {len(runs)} runs in {time.perf_counter() - start:.2f} s')
+    for file, error in catalogue[catalogue['error'].notna()][['file', 'error']].itertuples(index=False):
+        print(f'Error reading file {file}: {error}')
+    if len(runs) < len(catalogue):
+        exit(1)
+
+
+if __name__ == '__main__':
+    main(input_folder=folder)